@@ -1,27 +1,46 @@
 """
 Usage:
 
-    python agent.py
+    python agent.py [--new-session]
 """
 
 from __future__ import annotations
 
+import argparse
 import asyncio
+import concurrent.futures
+import functools
 import os
+import re
+import sys
+import threading
+import warnings
 from typing import Optional
 
 from google.adk.agents import Agent
-from google.adk.runners import InMemoryRunner
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.memory import InMemoryMemoryService
+from google.adk.runners import Runner
+from google.adk.sessions import BaseSessionService, InMemorySessionService, Session
 from google.genai import types
 
+try:  # Optional: faster event loop on POSIX platforms
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional
+    uvloop = None
+
 from tools.form_tools import (
     parse_form,
     autofill_form,
+    autofill_forms_batch,
     validate_form,
+    parse_and_validate_form,
     explain_field,
 )
 
 
+@functools.lru_cache(maxsize=1)
 def create_agent() -> Agent:
 
     model_id = os.environ.get("GEMINI_MODEL", "gemini-pro")
@@ -42,13 +61,153 @@ def create_agent() -> Agent:
             "results, and explain any jargon.  Always act as a courteous "
             "concierge."
         ),
-        tools=[parse_form, autofill_form, validate_form, explain_field],
+        tools=[
+            parse_form,
+            autofill_form,
+            autofill_forms_batch,
+            validate_form,
+            parse_and_validate_form,
+            explain_field,
+        ],
     )
 
 
-def run_console(agent: Agent, app_name: str = "paperwork_app", user_id: str = "user") -> None:
+SESSION_DIR = os.path.join(os.path.expanduser("~"), ".paperwork")
+
+_runner: Optional[Runner] = None
+_runner_persists_sessions = False
+
+
+def _persistent_session_service() -> BaseSessionService:
+    """Return a database-backed session service for the console.
+
+    Sessions go to SQLite under ``~/.paperwork`` unless ``PAPERWORK_SESSION_DB``
+    names another database URL.  If the database backend is unavailable (the
+    ``google-adk[db]`` extra or ``aiosqlite`` missing, or an ADK version that
+    rejects the URL), falls back to in-memory sessions with a warning.
+    """
+    try:
+        from google.adk.sessions import DatabaseSessionService
+
+        url = os.environ.get("PAPERWORK_SESSION_DB")
+        if not url:
+            os.makedirs(SESSION_DIR, exist_ok=True)
+            url = f"sqlite+aiosqlite:///{os.path.join(SESSION_DIR, 'sessions.db')}"
+        return DatabaseSessionService(db_url=url)
+    except Exception as exc:
+        warnings.warn(f"Session persistence unavailable, using in-memory sessions: {exc}")
+        return InMemorySessionService()
+
+
+def get_runner(
+    app_name: str = "paperwork_app",
+    agent: Optional[Agent] = None,
+    persist_sessions: bool = False,
+) -> Runner:
+    """Return a cached runner for ``agent`` (defaults to :func:`create_agent`).
+
+    The runner is rebuilt only when the app name, agent or session storage
+    changes, so the same runner and session service are reused across
+    sessions.  Sessions are kept in memory unless ``persist_sessions`` is set,
+    in which case they are stored in a database (see
+    :func:`_persistent_session_service`) and survive a restart.
+    """
+    global _runner, _runner_persists_sessions
+    if agent is None:
+        agent = create_agent()
+    if (
+        _runner is None
+        or _runner.app_name != app_name
+        or _runner.agent is not agent
+        or _runner_persists_sessions != persist_sessions
+    ):
+        session_service = (
+            _persistent_session_service() if persist_sessions else InMemorySessionService()
+        )
+        _runner = Runner(
+            app_name=app_name,
+            agent=agent,
+            artifact_service=InMemoryArtifactService(),
+            session_service=session_service,
+            memory_service=InMemoryMemoryService(),
+        )
+        _runner_persists_sessions = persist_sessions
+    return _runner
+
+
+def reset_agent_cache() -> None:
+    """Drop the cached agent and runner (mainly useful in tests)."""
+    global _runner
+    create_agent.cache_clear()
+    _runner = None
+
+
+def _session_file(user_id: str) -> str:
+    # Keep the user id from escaping SESSION_DIR or producing odd filenames
+    safe_id = re.sub(r"[^A-Za-z0-9_-]", "_", user_id)
+    return os.path.join(SESSION_DIR, f"session_{safe_id}.txt")
+
+
+async def _open_session(
+    runner: Runner, app_name: str, user_id: str, new_session: bool = False
+) -> Session:
+    """Resume the user's saved session, or create (and save) a new one.
+
+    The session itself lives in the runner's database-backed session service;
+    its id is kept in ``~/.paperwork/session_<user_id>.txt``.  A fresh session
+    is created when ``new_session`` is set, no id was saved, or the session
+    service no longer knows the saved id.  With an in-memory session service
+    nothing can be resumed, so no id is read or written.
+    """
+    if isinstance(runner.session_service, InMemorySessionService):
+        return await runner.session_service.create_session(app_name=app_name, user_id=user_id)
+
+    path = _session_file(user_id)
+    if not new_session:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved_id = f.read().strip()
+        except OSError:
+            saved_id = ""
+        if saved_id:
+            session = await runner.session_service.get_session(
+                app_name=app_name, user_id=user_id, session_id=saved_id
+            )
+            if session is not None:
+                return session
+
+    session = await runner.session_service.create_session(app_name=app_name, user_id=user_id)
+    try:
+        os.makedirs(SESSION_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(session.id)
+    except OSError:
+        pass  # Persisting the id is best effort
+    return session
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a non-negative number from the environment, or return ``default``."""
+    try:
+        value = float(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if 0 <= value < float("inf") else default
+
+
+async def run_console_async(
+    agent: Agent,
+    app_name: str = "paperwork_app",
+    user_id: str = "user",
+    new_session: bool = False,
+) -> None:
     """Run an interactive console to chat with the agent.
 
+    Agent output is streamed token by token (SSE mode): text parts of partial
+    events are printed as the runner yields them, batched until ``STREAM_FLUSH_CHARS`` characters (default 64) or
+    ``STREAM_FLUSH_MS`` milliseconds (default 50) have accumulated, and always
+    flushed at the end of a turn.
+
     Parameters
     ----------
     agent: Agent
@@ -57,15 +216,41 @@ def run_console(agent: Agent, app_name: str = "paperwork_app", user_id: str = "u
         Identifier for the app.  Used by the session service.
     user_id: str, default "user"
         Identifier for the user.  Sessions are scoped to a user.
+    new_session: bool, default False
+        If True, always start a fresh session instead of resuming the one
+        saved for ``user_id``.
     """
-    runner = InMemoryRunner(agent=agent, app_name=app_name)
-    # Create a session asynchronously
-    session = asyncio.run(runner.session_service.create_session(app_name=app_name, user_id=user_id))
+    runner = get_runner(app_name, agent, persist_sessions=True)
+    session = await _open_session(runner, app_name, user_id, new_session)
+    loop = asyncio.get_running_loop()
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    # Streamed text is buffered and flushed once either threshold is reached
+    flush_chars = int(_env_number("STREAM_FLUSH_CHARS", 64))
+    flush_secs = _env_number("STREAM_FLUSH_MS", 50) / 1000.0
+    buf: list[str] = []
+    buffered = 0
+    flush_timer: Optional[asyncio.TimerHandle] = None
+
+    def flush_buf() -> None:
+        nonlocal buffered, flush_timer
+        if flush_timer is not None:
+            flush_timer.cancel()
+            flush_timer = None
+        if buf:
+            write("".join(buf))
+            flush()
+            buf.clear()
+            buffered = 0
+
+    # SSE streaming makes the model's text arrive as partial events
+    run_config = RunConfig(streaming_mode=StreamingMode.SSE)
 
     print("Digital Paperwork Butler ready. Type 'quit' to exit.\n")
     while True:
         try:
-            user_message = input("You > ").strip()
+            # Read input in a worker thread so the event loop is never blocked
+            user_message = (await loop.run_in_executor(None, input, "You > ")).strip()
         except EOFError:
             break
         if user_message.lower() in {"quit", "exit"}:
@@ -74,16 +259,99 @@ def run_console(agent: Agent, app_name: str = "paperwork_app", user_id: str = "u
             continue
         content = types.Content(role="user", parts=[types.Part.from_text(text=user_message)])
         print("Agent > ", end="", flush=True)
-        # Run synchronously; iterate through events
-        for event in runner.run(user_id=user_id, session_id=session.id, new_message=content):
-            # Print only textual parts of the response
-            if event.content and event.content.parts:
-                part = event.content.parts[0]
-                if hasattr(part, "text") and part.text:
-                    print(part.text, end="", flush=True)
-        print("\n", flush=True)
+        async for event in runner.run_async(
+            user_id=user_id, session_id=session.id, new_message=content, run_config=run_config
+        ):
+            got_text = False
+            # Only partial events are printed: the final aggregated event
+            # repeats the text that was already streamed.
+            if event.partial and event.content and event.content.parts:
+                for part in event.content.parts:
+                    if part.thought:
+                        continue  # Don't print the model's reasoning
+                    text = getattr(part, "text", None)
+                    if text:
+                        buf.append(text)
+                        buffered += len(text)
+                        got_text = True
+            # Anything that is not more text (a tool call, the final event)
+            # may be followed by a long pause, so show what we have now.
+            if buffered >= flush_chars or not got_text or event.get_function_calls():
+                flush_buf()
+            elif flush_timer is None:
+                flush_timer = loop.call_later(flush_secs, flush_buf)
+        # Always flush whatever is left at the end of the turn
+        buf.append("\n\n")
+        flush_buf()
+
+
+def _run_new_loop(coro):
+    """Run ``coro`` to completion on a fresh event loop (uvloop if installed)."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as loop_runner:
+            return loop_runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
+def _run_in_new_thread(coro):
+    """Run ``coro`` on its own event loop in a worker thread and wait for it."""
+    future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def target() -> None:
+        try:
+            future.set_result(_run_new_loop(coro))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=target, name="paperwork-loop", daemon=True).start()
+    return future.result()
+
+
+def _run_coro(coro):
+    """Run ``coro`` from synchronous code, even if an event loop is running.
+
+    ``asyncio.run`` refuses to start inside a running loop (FastAPI, Jupyter).
+    In that case the coroutine runs on a separate loop in a worker thread, or
+    on the current loop via ``nest_asyncio`` when ``PAPERWORK_NEST_ASYNCIO=1``.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_new_loop(coro)
+    if os.environ.get("PAPERWORK_NEST_ASYNCIO") == "1":
+        import nest_asyncio
+
+        nest_asyncio.apply(loop)
+        return loop.run_until_complete(coro)
+    return _run_in_new_thread(coro)
+
+
+def run_console(
+    agent: Agent,
+    app_name: str = "paperwork_app",
+    user_id: str = "user",
+    new_session: bool = False,
+) -> None:
+    """Synchronous entry point for :func:`run_console_async`.
+
+    Uses ``uvloop`` as the event loop when it is installed, and can be called
+    from code that already runs an event loop.
+    """
+    _run_coro(
+        run_console_async(agent, app_name=app_name, user_id=user_id, new_session=new_session)
+    )
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chat with the Digital Paperwork Butler.")
+    parser.add_argument(
+        "--new-session",
+        action="store_true",
+        help="start a fresh session instead of resuming the saved one",
+    )
+    args = parser.parse_args()
     agent = create_agent()
-    run_console(agent)
+    run_console(agent, new_session=args.new_session)
@@ -1,36 +1,286 @@
 """
 Functions:
 
-* `parse_form` – Extracts form fields from a PDF and returns a mapping of field
-  names to their current values.
-* `autofill_form` – Fills blank fields in a PDF using supplied user data and
-  writes a new PDF file.
+* `parse_form` – (async) Extracts form fields from a PDF and returns a mapping
+  of field names to their current values.
+* `parse_form_stream` – Async iterator over the same ``(name, value)`` pairs,
+  for async callers that want to process large forms incrementally.
+* `autofill_form` – (async) Fills blank fields in a PDF using supplied user
+  data and writes a new PDF file.
+* `autofill_forms_batch` – (async) Runs `autofill_form` over several PDFs
+  concurrently and reports the outcome for each one.
 * `validate_form` – Validates a dictionary of field values for emptiness and
   basic formats.
+* `parse_and_validate_form` – (async) Combines `parse_form` and
+  `validate_form` in a single pass over the form fields.
 * `explain_field` – Uses Gemini (via the agent) to explain the meaning of a
   form field in plain language.  Although this function itself does not
   interface with Gemini, its signature allows the agent to call it as a tool
   and then interpret the return using the LLM.
 
 Notes:
-  - These tools rely on the `pypdf` library for PDF manipulation.
+  - These tools rely on the `pypdf` library for PDF manipulation.  When
+    `pikepdf` is installed, fields are extracted with it instead, which is much
+    faster on large forms; filling and flattening always use `pypdf`.
+  - The PDF tools are coroutines that run the blocking pypdf work in a worker
+    thread, so the agent's event loop keeps streaming while a form is read or
+    written.
   - No sensitive data is stored in code.  User data is passed in from the
     agent state or from the caller.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import gc
+import itertools
 import json
 import os
 import re
+import string
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from io import BytesIO
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from pypdf import PdfReader, PdfWriter
 
+try:  # Optional: qpdf-backed (C++) field extraction for the read path
+    import pikepdf
+except ImportError:  # pragma: no cover - pikepdf is optional (pip install pikepdf)
+    pikepdf = None
+
+
+# Validation rules used by ``validate_form``.  Dates need a structural
+# pattern; phone numbers and postal codes are plain character-class checks, so
+# a value is valid when deleting every allowed character leaves nothing.
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_PHONE_STRIP = str.maketrans("", "", "+0123456789 -\t")
+_POSTAL_STRIP = str.maketrans("", "", string.ascii_letters + string.digits + " -_\t")
+
+
+def _is_valid_date(val: str) -> bool:
+    return _DATE_RE.match(val) is not None
+
+
+def _is_valid_phone(val: str) -> bool:
+    return bool(val) and not val.translate(_PHONE_STRIP)
+
+
+def _is_valid_postal(val: str) -> bool:
+    return bool(val) and not val.translate(_POSTAL_STRIP)
+
+
+def _is_invalid(name: str, val: str) -> bool:
+    """Return True if the non-empty ``val`` breaks the rule for field ``name``.
+
+    The rule is picked from the field name: date > phone > postal/zip.
+    Fields matching none of them are always valid.
+    """
+    nlow = name.lower()
+    if "date" in nlow:
+        return not _is_valid_date(val)
+    if "phone" in nlow:
+        return not _is_valid_phone(val)
+    if "postal" in nlow or "zip" in nlow:
+        return not _is_valid_postal(val)
+    # Add more rules as needed
+    return False
+
 
 # Helper
 
+# Parsed readers keyed by absolute path; least recently used first.
+_READER_CACHE_SIZE = 8
+# Forms larger than this trigger an explicit garbage collection after filling
+_GC_THRESHOLD_BYTES = 10_000_000
+
+
+@dataclass
+class _CachedReader:
+    """A parsed PDF plus the data memoised from it.
+
+    Tools may run concurrently in worker threads, so ``lock`` must be held
+    while using ``reader`` or filling in the memoised maps.
+    """
+
+    reader: PdfReader
+    mtime: float
+    size: int
+    lock: threading.RLock
+    fields: Optional[Dict[str, dict]] = None
+    blank_fields: Optional[Dict[str, List[str]]] = None
+    field_pages: Optional[Dict[str, List[int]]] = None
+
+
+_reader_cache: "OrderedDict[str, _CachedReader]" = OrderedDict()
+_reader_cache_lock = threading.Lock()
+
+
+def _get_cached_reader(pdf_path: Union[str, Path]) -> _CachedReader:
+    """Return the shared, parsed ``pdf_path``.
+
+    Readers are cached per file and reused while the file's modification time
+    is unchanged, so chained tool calls on the same form skip re-parsing.  A
+    single ``stat`` serves both the existence check and the cache check.  A
+    modified file replaces its old entry rather than sitting next to it.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified PDF does not exist.
+    """
+    p = Path(pdf_path).absolute()
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PDF not found: {pdf_path}") from None
+    key = str(p)
+    with _reader_cache_lock:
+        cached = _reader_cache.get(key)
+        if cached is not None and cached.mtime == st.st_mtime:
+            _reader_cache.move_to_end(key)
+            return cached
+    # Read the file once through our own handle; the cached reader must not
+    # depend on an open file.
+    with p.open("rb") as fh:
+        reader = PdfReader(BytesIO(fh.read()), strict=False)
+    cached = _CachedReader(reader, st.st_mtime, st.st_size, threading.RLock())
+    with _reader_cache_lock:
+        _reader_cache[key] = cached
+        _reader_cache.move_to_end(key)
+        while len(_reader_cache) > _READER_CACHE_SIZE:
+            _reader_cache.popitem(last=False)
+    return cached
+
+
+def _get_fields(cached: _CachedReader) -> Dict[str, dict]:
+    """Return ``reader.get_fields()``, memoised on the cache entry."""
+    if cached.fields is None:
+        # get_form_text_fields returns only text fields; get_fields returns all
+        try:
+            cached.fields = cached.reader.get_fields() or {}
+        except Exception:
+            cached.fields = {}
+    return cached.fields
+
+
+def _qualified_name(annotation) -> Optional[str]:
+    """Return the fully qualified field name of a widget annotation."""
+    parts: List[str] = []
+    node = annotation
+    while node is not None:
+        if "/T" in node:
+            parts.append(str(node["/T"]))
+        parent = node.get("/Parent")
+        node = parent.get_object() if parent is not None else None
+    return ".".join(reversed(parts)) or None
+
+
+def _get_blank_fields(cached: _CachedReader) -> Dict[str, List[str]]:
+    """Map lowercased names of blank fields to the field names themselves.
+
+    Several fields can share a lowercased name.  Memoised on the cache entry.
+    """
+    if cached.blank_fields is None:
+        blank: Dict[str, List[str]] = {}
+        for name, field in _get_fields(cached).items():
+            if field.get("/V") in ("", None):
+                blank.setdefault(name.lower(), []).append(name)
+        cached.blank_fields = blank
+    return cached.blank_fields
+
+
+def _lower_keys(data: Dict[str, str]) -> Dict[str, str]:
+    """Return a copy of ``data`` keyed by lowercased keys."""
+    return dict(zip(map(str.lower, data.keys()), data.values()))
+
+
+def _get_field_pages(cached: _CachedReader) -> Dict[str, List[int]]:
+    """Map each field name to the indices of the pages holding its widgets.
+
+    Built once from the pages' widget annotations and memoised on the cache
+    entry.
+    """
+    if cached.field_pages is None:
+        field_pages: Dict[str, List[int]] = {}
+        for idx, page in enumerate(cached.reader.pages):
+            for annot in page.get("/Annots") or ():
+                annot = annot.get_object()
+                if annot.get("/Subtype") != "/Widget":
+                    continue
+                name = _qualified_name(annot)
+                if name is None:
+                    continue
+                pages = field_pages.setdefault(name, [])
+                if not pages or pages[-1] != idx:
+                    pages.append(idx)
+        cached.field_pages = field_pages
+    return cached.field_pages
+
+
+def _dict_value_text(value) -> str:
+    """Describe a dictionary ``/V`` (e.g. a signature) by its ``/Type``.
+
+    Both backends use this so neither leaks a library repr into the result.
+    """
+    return str(value.get("/Type") or "/Dictionary")
+
+
+def _walk_pike_fields(fields, parent_name: str = "") -> Iterator[Tuple[str, Optional[str]]]:
+    """Yield ``(qualified name, value)`` for a pikepdf AcroForm field tree.
+
+    Mirrors ``PdfReader.get_fields``: every node with a ``/T`` is reported
+    (including parent fields), named ``parent.child``, with its own ``/V``
+    formatted the same way ``parse_form`` formats pypdf values.
+    """
+    for field in fields:
+        partial = field.get("/T")
+        if partial is None:
+            continue  # A bare widget annotation, not a field
+        name = f"{parent_name}.{partial}" if parent_name else str(partial)
+        value = field.get("/V")
+        if value is None:
+            yield name, None
+        elif isinstance(value, pikepdf.Array):
+            # Multi-select choices: format like pypdf's list, not pikepdf's repr
+            yield name, str([str(item) for item in value])
+        elif isinstance(value, pikepdf.Dictionary):
+            yield name, _dict_value_text(value)
+        else:
+            text = str(value)
+            yield name, text if text != "" else None
+        kids = field.get("/Kids")
+        if kids is not None:
+            yield from _walk_pike_fields(kids, name)
+
+
+@functools.lru_cache(maxsize=_READER_CACHE_SIZE)
+def _read_pike_fields(path: str, mtime: float) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Extract all form fields with pikepdf; cached per (path, mtime)."""
+    with pikepdf.open(path) as pdf:
+        acroform = pdf.Root.get("/AcroForm")
+        fields = acroform.get("/Fields") if acroform is not None else None
+        if fields is None:
+            return ()
+        return tuple(_walk_pike_fields(fields))
+
+
+def _pike_field_items(pdf_path: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Return the ``(name, value)`` pairs of a form using pikepdf."""
+    p = Path(pdf_path).absolute()
+    try:
+        mtime = p.stat().st_mtime
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PDF not found: {pdf_path}") from None
+    return _read_pike_fields(str(p), mtime)
+
+
 def _load_user_data(user_data_path: str) -> Dict[str, str]:
     """Load user metadata from a JSON file.
 
@@ -48,10 +298,74 @@ def _load_user_data(user_data_path: str) -> Dict[str, str]:
         return json.load(f)
 
 
+_DEFAULT_USER_DATA_PATH = os.path.join(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)),
+    "metadata",
+    "user_data.json",
+)
+# (mtime, data, data keyed by lowercased name) for the default profile
+_USER_DATA_CACHE: Optional[Tuple[float, Dict[str, str], Dict[str, str]]] = None
+
+
+def _get_default_user_data() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Return the default user profile and its lowercased-key mirror.
+
+    The JSON file is only re-read when its modification time changes.  A
+    missing or unreadable file yields empty mappings.
+    """
+    global _USER_DATA_CACHE
+    try:
+        mtime = os.stat(_DEFAULT_USER_DATA_PATH).st_mtime
+    except OSError:
+        return {}, {}
+    cached = _USER_DATA_CACHE
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    try:
+        data = _load_user_data(_DEFAULT_USER_DATA_PATH)
+    except Exception:
+        return {}, {}
+    data_lower = _lower_keys(data)
+    _USER_DATA_CACHE = (mtime, data, data_lower)
+    return data, data_lower
+
 
 # Tool
 
-def parse_form(pdf_path: str) -> Dict[str, Optional[str]]:
+def _iter_fields(cached: _CachedReader) -> Iterator[Tuple[str, Optional[str]]]:
+    """Yield ``(name, value)`` for each form field; blank values are ``None``."""
+    for name, field in _get_fields(cached).items():
+        value = field.get("/V")
+        if value == "" or value is None:
+            yield name, None
+        elif isinstance(value, dict):
+            yield name, _dict_value_text(value)
+        else:
+            yield name, str(value)
+
+
+@contextmanager
+def _field_items(pdf_path: str) -> Iterator[Iterator[Tuple[str, Optional[str]]]]:
+    """Provide an iterator over a form's ``(name, value)`` pairs.
+
+    Uses pikepdf when available, otherwise the shared pypdf reader (whose lock
+    is held for the duration of the ``with`` block).
+    """
+    if pikepdf is not None:
+        yield iter(_pike_field_items(pdf_path))
+        return
+    cached = _get_cached_reader(pdf_path)
+    with cached.lock:
+        yield _iter_fields(cached)
+
+
+def _parse_form_sync(pdf_path: str) -> Dict[str, Optional[str]]:
+    """Blocking implementation of :func:`parse_form`."""
+    with _field_items(pdf_path) as items:
+        return dict(items)
+
+
+async def parse_form(pdf_path: str) -> Dict[str, Optional[str]]:
     """Extract form fields and their values from a PDF form.
 
     Given a path to a PDF file containing AcroForm fields, this function
@@ -75,26 +389,114 @@ def parse_form(pdf_path: str) -> Dict[str, Optional[str]]:
     FileNotFoundError
         If the specified PDF does not exist.
     """
-    if not os.path.exists(pdf_path):
-        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    return await asyncio.to_thread(_parse_form_sync, pdf_path)
 
-    reader = PdfReader(pdf_path)
-    # get_form_text_fields returns only text fields; get_fields returns all
-    try:
-        fields = reader.get_fields()
-    except Exception:
-        fields = {}
-    result: Dict[str, Optional[str]] = {}
-    for name, field in (fields or {}).items():
-        value = field.get("/V")
-        if value == "" or value is None:
-            result[name] = None
-        else:
-            result[name] = str(value)
-    return result
 
+async def parse_form_stream(
+    pdf_path: str, chunk_size: int = 256
+) -> AsyncIterator[Tuple[str, Optional[str]]]:
+    """Asynchronously yield ``(name, value)`` pairs from a PDF form.
+
+    Streaming counterpart of :func:`parse_form` for async consumers.  Fields
+    are extracted in a worker thread so the event loop is never blocked, and
+    no full result dict is built.  With the pypdf backend they are pulled
+    ``chunk_size`` at a time; pikepdf extracts them in one (fast) pass.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified PDF does not exist.
+    """
+    if pikepdf is not None:
+        for item in await asyncio.to_thread(_pike_field_items, pdf_path):
+            yield item
+        return
+
+    cached = await asyncio.to_thread(_get_cached_reader, pdf_path)
+    fields = _iter_fields(cached)
+
+    def next_chunk() -> List[Tuple[str, Optional[str]]]:
+        with cached.lock:
+            return list(itertools.islice(fields, chunk_size))
 
-def autofill_form(
+    while True:
+        chunk = await asyncio.to_thread(next_chunk)
+        if not chunk:
+            return
+        for item in chunk:
+            yield item
+
+
+def _output_path(pdf_path: Union[str, Path], output_dir: Optional[str]) -> Path:
+    """Return where :func:`autofill_form` writes the filled copy of ``pdf_path``."""
+    p = Path(pdf_path)
+    return (Path(output_dir) if output_dir else p.parent) / f"{p.stem}_filled.pdf"
+
+
+def _autofill_form_sync(
+    pdf_path: str,
+    user_data: Optional[Dict[str, str]] = None,
+    output_dir: Optional[str] = None,
+    flatten: bool = False,
+) -> str:
+    """Blocking implementation of :func:`autofill_form`."""
+    p = Path(pdf_path)
+    cached = _get_cached_reader(p)
+
+    # Build a mapping of field names to fill values (case‑insensitive)
+    # If no user_data provided, use the (cached) defaults.
+    if user_data is None:
+        user_data, user_data_lower = _get_default_user_data()
+    else:
+        user_data_lower = _lower_keys(user_data)
+
+    # Everything that touches the shared reader happens under its lock; the
+    # writer is private to this call.
+    with cached.lock:
+        # Clone the document root so the AcroForm is kept and pages are not re-merged
+        writer = PdfWriter(clone_from=cached.reader)
+        # Walk the user data (usually much smaller than the form) and look up
+        # the blank fields each key would fill.
+        blank_fields = _get_blank_fields(cached)
+        fill_values: Dict[str, str] = {}
+        for key_lower, value in user_data_lower.items():
+            for name in blank_fields.get(key_lower, ()):
+                fill_values[name] = value
+        field_pages = _get_field_pages(cached)
+
+    # Partition the fill values by the pages their widgets live on, so each
+    # page is updated once with only its own fields.  Fields without a known
+    # widget fall back to the first page.
+    page_to_fields: Dict[int, Dict[str, str]] = {}
+    for name, value in fill_values.items():
+        for idx in field_pages.get(name, (0,)):
+            page_to_fields.setdefault(idx, {})[name] = value
+
+    # When flattening, appearances are generated in the same pass.
+    for idx, subset in page_to_fields.items():
+        writer.update_page_form_field_values(
+            writer.pages[idx], subset, auto_regenerate=not flatten, flatten=flatten
+        )
+
+    if flatten:
+        # Remove widget annotations
+        writer.remove_annotations(subtypes="/Widget")
+
+    # Determine output path
+    out_path = _output_path(p, output_dir)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("wb") as f_out:
+        writer.write(f_out)
+
+    # Release the writer's object graph now rather than whenever the
+    # collector next runs; pypdf objects are full of reference cycles.
+    del writer
+    if cached.size > _GC_THRESHOLD_BYTES:
+        gc.collect()
+    return str(out_path)
+
+
+async def autofill_form(
     pdf_path: str,
     user_data: Optional[Dict[str, str]] = None,
     output_dir: Optional[str] = None,
@@ -124,53 +526,72 @@ def autofill_form(
     str
         The path to the filled PDF file.
     """
-    if not os.path.exists(pdf_path):
-        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    return await asyncio.to_thread(_autofill_form_sync, pdf_path, user_data, output_dir, flatten)
 
-    reader = PdfReader(pdf_path)
-    writer = PdfWriter()
-    writer.append(reader)
 
-    # Build a mapping of field names to fill values (case‑insensitive)
-    # If no user_data provided, attempt to load defaults.
-    if user_data is None:
-        
-        repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
-        default_path = os.path.join(repo_root, "metadata", "user_data.json")
-        try:
-            user_data = _load_user_data(default_path)
-        except Exception:
-            user_data = {}
+async def autofill_forms_batch(
+    pdf_paths: List[str],
+    user_data: Optional[Dict[str, str]] = None,
+    output_dir: Optional[str] = None,
+    flatten: bool = False,
+    concurrency: int = 4,
+) -> List[Dict[str, str]]:
+    """Autofill several PDF forms concurrently.
 
-    user_data_lower = {k.lower(): v for k, v in user_data.items()}
-    fields = reader.get_fields() or {}
-    fill_values: Dict[str, str] = {}
-    for name, field in fields.items():
-        value = field.get("/V")
-        # If field is empty or none
-        if value in ("", None):
-            key_lower = name.lower()
-            if key_lower in user_data_lower:
-                fill_values[name] = user_data_lower[key_lower]
+    Each form is filled exactly as by :func:`autofill_form`; up to
+    ``concurrency`` forms are processed at the same time.  A form that cannot
+    be filled (missing, unreadable, corrupt) is reported in its own entry and
+    does not stop the others.
 
-    # Fill the fields on the first page (works for most simple forms)
-    if fill_values:
-        writer.update_page_form_field_values(writer.pages[0], fill_values, auto_regenerate=False)
+    Parameters
+    ----------
+    pdf_paths: List[str]
+        Paths to the original PDF files.
+    user_data, output_dir, flatten
+        As for :func:`autofill_form`, applied to every form.
+    concurrency: int, default 4
+        Maximum number of forms filled in parallel.
 
-    if flatten:
-        # Flatten the form by regenerating appearances and removing annotations
-        writer.update_page_form_field_values(writer.pages[0], fill_values, auto_regenerate=False, flatten=True)
-        # Remove widget annotations
-        writer.remove_annotations(subtypes="/Widget")
+    Returns
+    -------
+    List[Dict[str, str]]
+        One entry per input, in the same order as ``pdf_paths``.  Each entry
+        has a ``pdf_path`` key and either ``output_path`` (the filled PDF) or
+        ``error`` (why that form could not be filled).
 
-    # Determine output path
-    base_name = os.path.splitext(os.path.basename(pdf_path))[0]
-    out_dir = output_dir or os.path.dirname(pdf_path)
-    os.makedirs(out_dir, exist_ok=True)
-    output_path = os.path.join(out_dir, f"{base_name}_filled.pdf")
-    with open(output_path, "wb") as f_out:
-        writer.write(f_out)
-    return output_path
+    Raises
+    ------
+    ValueError
+        If two inputs would be written to the same output file.  This is a
+        problem with the batch as a whole rather than with one form, so it is
+        checked before any form is written.
+    """
+    outputs: Dict[str, str] = {}
+    for path in pdf_paths:
+        key = os.path.normcase(os.path.abspath(_output_path(path, output_dir)))
+        if key in outputs:
+            raise ValueError(
+                f"{outputs[key]} and {path} would both be written to {key}; "
+                "rename one of them or fill them separately"
+            )
+        outputs[key] = path
+
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def fill(path: str) -> str:
+        async with sem:
+            return await asyncio.to_thread(_autofill_form_sync, path, user_data, output_dir, flatten)
+
+    results = await asyncio.gather(*(fill(path) for path in pdf_paths), return_exceptions=True)
+    report: List[Dict[str, str]] = []
+    for path, result in zip(pdf_paths, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result  # Cancellation and interpreter exits propagate
+            report.append({"pdf_path": path, "error": f"{type(result).__name__}: {result}"})
+        else:
+            report.append({"pdf_path": path, "output_path": result})
+    return report
 
 
 def validate_form(fields: Dict[str, Optional[str]]) -> Dict[str, List[str]]:
@@ -198,31 +619,73 @@ def validate_form(fields: Dict[str, Optional[str]]) -> Dict[str, List[str]]:
     """
     missing: List[str] = []
     invalid: List[str] = []
-
-    date_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-    phone_pattern = re.compile(r"^[\+\d\s\-]+$")
-    postal_pattern = re.compile(r"^[\w\s-]+$")
+    missing_add = missing.append
+    invalid_add = invalid.append
 
     for name, value in fields.items():
-        if value is None or str(value).strip() == "":
-            missing.append(name)
+        if value is None:
+            missing_add(name)
             continue
-        val = str(value).strip()
-        # Example simple validation rules
-        if "date" in name.lower():
-            if not date_pattern.match(val):
-                invalid.append(name)
-        elif "phone" in name.lower():
-            if not phone_pattern.match(val):
-                invalid.append(name)
-        elif "postal" in name.lower() or "zip" in name.lower():
-            if not postal_pattern.match(val):
-                invalid.append(name)
-        # Add more rules as needed
+        val = (value if isinstance(value, str) else str(value)).strip()
+        if not val:
+            missing_add(name)
+            continue
+        if _is_invalid(name, val):
+            invalid_add(name)
 
     return {"missing": missing, "invalid": invalid}
 
 
+def _parse_and_validate_form_sync(pdf_path: str) -> Dict[str, Any]:
+    """Blocking implementation of :func:`parse_and_validate_form`."""
+    values: Dict[str, Optional[str]] = {}
+    missing: List[str] = []
+    invalid: List[str] = []
+    missing_add = missing.append
+    invalid_add = invalid.append
+
+    with _field_items(pdf_path) as items:
+        for name, value in items:
+            values[name] = value
+            if value is None:
+                missing_add(name)
+                continue
+            val = value.strip()
+            if not val:
+                missing_add(name)
+                continue
+            if _is_invalid(name, val):
+                invalid_add(name)
+
+    return {"fields": values, "missing": missing, "invalid": invalid}
+
+
+async def parse_and_validate_form(pdf_path: str) -> Dict[str, Any]:
+    """Extract form fields from a PDF and validate them in a single pass.
+
+    Equivalent to calling :func:`parse_form` followed by
+    :func:`validate_form`, but walks the fields only once.
+
+    Parameters
+    ----------
+    pdf_path: str
+        Path to the PDF file to analyse.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A dictionary with three keys: ``fields`` (the mapping returned by
+        :func:`parse_form`), ``missing`` and ``invalid`` (the lists returned
+        by :func:`validate_form`).
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified PDF does not exist.
+    """
+    return await asyncio.to_thread(_parse_and_validate_form_sync, pdf_path)
+
+
 def explain_field(field_name: str) -> str:
     """
     Parameters
@@ -245,7 +708,10 @@ def explain_field(field_name: str) -> str:
 
 __all__ = [
     "parse_form",
+    "parse_form_stream",
     "autofill_form",
+    "autofill_forms_batch",
     "validate_form",
+    "parse_and_validate_form",
     "explain_field",
 ]